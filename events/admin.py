@@ -3,25 +3,61 @@ import json
 import os
 import re
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import StringIO
 from pathlib import PurePosixPath
 from django.conf import settings
 from django.contrib import admin, messages
 from django.core.files.base import ContentFile
+from django.db import connection
+from django.db.models import Count
+from django.db.models.functions import Length, Substr
 from django.http import HttpResponseRedirect
 from django.template.response import TemplateResponse
 from django.urls import path, reverse
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 
 from .models import Event, Photo, UploadChannel
 from .utils import generate_event_qr_code, qr_preview_payload_for_event
 from .validators import DEFAULT_ALLOWED_EXTENSIONS
 from .widgets import ColorPickerWidget
 
+# Computed once at import; saves a rstrip per admin render.
+_EVENT_BASE_URL = settings.EVENT_BASE_URL.rstrip("/")
+
+# Static HTML fragments for qr_code_preview, built once at import instead of
+# re-assembling the literals on every change-form render. Substitutions still
+# go through format_html so values are escaped.
+_QR_MISSING_HTML = mark_safe(
+    "No QR code yet. Either assign this event as the <strong>current event</strong> on an "
+    "<a href=\"/admin/events/uploadchannel/\">Upload channel</a>, then generate the QR, "
+    "or use the legacy “Generate QR code for selected events” action (slug-based link)."
+)
+
+_QR_CHANNEL_NOTE_TEMPLATE = (
+    '<p style="font-size:0.85rem;color:#666;margin-top:0.5rem;">'
+    "Reusable upload channel: <strong>{}</strong>. The same printed QR works for future events "
+    "when you point the channel’s current event to a new one."
+    "</p>"
+)
+
+_QR_PREVIEW_TEMPLATE = (
+    '<div style="display:flex; flex-direction:column; gap:0.75rem;">'
+    '<img src="{}" alt="QR code" style="max-width:220px; border:1px solid #ddd; padding:6px; border-radius:8px;">'
+    '<a href="{}" target="_blank" rel="noopener">Download QR code</a>'
+    '<div style="font-size:0.9rem; color:#555;">'
+    '<div>Guest upload link:</div>'
+    '<code style="display:inline-block; padding:4px 6px; margin-top:4px; background:#f7f7f7; border-radius:4px;">{}</code>'
+    '</div>'
+    "{}"
+    "</div>"
+)
+
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
-    list_display = ("name", "slug", "is_active", "start_time", "end_time")
+    list_display = ("name", "slug", "is_active", "start_time", "end_time", "photo_count")
     list_filter = ("is_active",)
     search_fields = ("name", "slug")
     prepopulated_fields = {"slug": ("name",)}
@@ -34,16 +70,21 @@ class EventAdmin(admin.ModelAdmin):
     )
     actions = ("generate_qr_codes",)
     
-    # Color fields that should use the color picker widget
-    COLOR_FIELDS = [
+    # Color fields that should use the color picker widget.
+    # Frozenset: formfield_for_dbfield runs per field per form render, so
+    # membership should be O(1) rather than a list scan.
+    COLOR_FIELDS = frozenset({
         'bg_color_1', 'bg_color_2', 'bg_color_3',
         'primary_color', 'accent_color_1', 'accent_color_2',
         'text_primary_color', 'text_muted_color',
-    ]
-    
+    })
+
     def formfield_for_dbfield(self, db_field, request, **kwargs):
         """
         Override to use ColorPickerWidget for color fields.
+
+        A fresh widget per field is deliberate: CharField mutates
+        widget.attrs (e.g. maxlength), so instances can't be shared safely.
         """
         if db_field.name in self.COLOR_FIELDS:
             kwargs['widget'] = ColorPickerWidget()
@@ -77,38 +118,38 @@ class EventAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).annotate(_photo_count=Count("photos"))
+        if request.resolver_match and request.resolver_match.url_name == "events_event_changelist":
+            # The changelist renders a handful of columns; skip the ~10
+            # personalization text/color fields. The change form still
+            # loads the full row.
+            queryset = queryset.only("id", "name", "slug", "is_active", "start_time", "end_time")
+        return queryset
+
+    def photo_count(self, obj):
+        return obj._photo_count
+
+    photo_count.short_description = "Photos"
+    photo_count.admin_order_field = "_photo_count"
+
     def qr_code_preview(self, obj):
         if not obj or not obj.slug:
             return "Save the event to generate a QR code."
 
         payload = qr_preview_payload_for_event(obj)
         if not payload:
-            return format_html(
-                "No QR code yet. Either assign this event as the <strong>current event</strong> on an "
-                "<a href=\"/admin/events/uploadchannel/\">Upload channel</a>, then generate the QR, "
-                "or use the legacy “Generate QR code for selected events” action (slug-based link)."
-            )
+            return _QR_MISSING_HTML
 
         extra = ""
         if payload.get("kind") == "channel":
             extra = format_html(
-                '<p style="font-size:0.85rem;color:#666;margin-top:0.5rem;">'
-                "Reusable upload channel: <strong>{}</strong>. The same printed QR works for future events "
-                "when you point the channel’s current event to a new one."
-                "</p>",
+                _QR_CHANNEL_NOTE_TEMPLATE,
                 payload.get("channel_label", ""),
             )
 
         return format_html(
-            '<div style="display:flex; flex-direction:column; gap:0.75rem;">'
-            '<img src="{}" alt="QR code" style="max-width:220px; border:1px solid #ddd; padding:6px; border-radius:8px;">'
-            '<a href="{}" target="_blank" rel="noopener">Download QR code</a>'
-            '<div style="font-size:0.9rem; color:#555;">'
-            '<div>Guest upload link:</div>'
-            '<code style="display:inline-block; padding:4px 6px; margin-top:4px; background:#f7f7f7; border-radius:4px;">{}</code>'
-            '</div>'
-            "{}"
-            "</div>",
+            _QR_PREVIEW_TEMPLATE,
             payload["image_url"],
             payload["download_url"],
             payload["target_url"],
@@ -126,7 +167,7 @@ class EventAdmin(admin.ModelAdmin):
             "events:customer-gallery",
             kwargs={"slug": obj.slug, "uid": gallery_uid},
         )
-        absolute_gallery_url = f"{settings.EVENT_BASE_URL.rstrip('/')}{gallery_path}"
+        absolute_gallery_url = f"{_EVENT_BASE_URL}{gallery_path}"
         return format_html(
             '<a href="{0}" target="_blank" rel="noopener">{0}</a>',
             absolute_gallery_url,
@@ -342,20 +383,39 @@ class EventAdmin(admin.ModelAdmin):
         }
         return TemplateResponse(request, "admin/events/event/import_gallery.html", context)
 
+    @staticmethod
+    def _generate_qr_in_worker(event):
+        # generate_event_qr_code queries UploadChannel, so each worker
+        # thread opens its own DB connection. Django only closes the request
+        # thread's connection, and with conn_max_age these would otherwise
+        # stay open until the thread object is collected.
+        try:
+            return generate_event_qr_code(event)
+        finally:
+            connection.close()
+
     def generate_qr_codes(self, request, queryset):
         generated = 0
         skipped = 0
-        for event in queryset:
-            try:
-                generate_event_qr_code(event)
-                generated += 1
-            except Exception as exc:  # pragma: no cover - defensive
-                skipped += 1
-                self.message_user(
-                    request,
-                    f"Failed to generate QR for '{event}': {exc}",
-                    level=messages.ERROR,
-                )
+        events = list(queryset)
+        # Each event's QR is independent and the PNG encode releases the GIL,
+        # so a small thread pool cuts bulk-action latency roughly by the
+        # worker count. Results are collected on the request thread.
+        max_workers = min(8, os.cpu_count() or 4, max(len(events), 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._generate_qr_in_worker, event): event for event in events}
+            for future in as_completed(futures):
+                event = futures[future]
+                try:
+                    future.result()
+                    generated += 1
+                except Exception as exc:  # pragma: no cover - defensive
+                    skipped += 1
+                    self.message_user(
+                        request,
+                        f"Failed to generate QR for '{event}': {exc}",
+                        level=messages.ERROR,
+                    )
         if generated:
             self.message_user(
                 request,
@@ -380,7 +440,8 @@ class UploadChannelAdmin(admin.ModelAdmin):
 
 @admin.register(Photo)
 class PhotoAdmin(admin.ModelAdmin):
-    list_display = ("event", "uploaded_at", "short_comment", "thumbnail")
+    list_display = ("event", "uploaded_at", "short_comment", "thumbnail_preview")
+    list_select_related = ("event",)
     list_filter = ("event", "uploaded_at")
     search_fields = ("event__name", "comment")
     readonly_fields = ("uploaded_at", "uploader_ip", "preview")
@@ -393,30 +454,59 @@ class PhotoAdmin(admin.ModelAdmin):
         "uploader_ip",
     )
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).select_related("event")
+        if request.resolver_match and request.resolver_match.url_name == "events_photo_changelist":
+            # Truncate comments DB-side so the changelist never transfers
+            # full TEXT bodies; the change form still loads the full row.
+            queryset = queryset.defer("comment", "uploader_ip").annotate(
+                _short_comment=Substr("comment", 1, 40),
+                _comment_length=Length("comment"),
+            )
+        return queryset
+
     def short_comment(self, obj):
-        if not obj.comment:
+        short = getattr(obj, "_short_comment", None)
+        if short is None:
+            short = obj.comment[:40]
+            length = len(obj.comment)
+        else:
+            length = obj._comment_length
+        if not short:
             return ""
-        return (obj.comment[:40] + "…") if len(obj.comment) > 40 else obj.comment
+        return f"{short}…" if length > 40 else short
 
     short_comment.short_description = "Comment"
 
-    def thumbnail(self, obj):
+    def thumbnail_preview(self, obj):
+        # Must not be named "thumbnail": lookup_field resolves the model
+        # field of that name first and would render its raw file path.
         if not obj.image:
             return "—"
+        # Prefer the pre-generated WEBP thumbnail; CSS-scaling the original
+        # would make the changelist download every full-size photo.
+        image_url = obj.thumbnail.url if obj.thumbnail else obj.image.url
         return format_html(
             '<img src="{}" style="max-height: 60px; max-width: 60px; border-radius: 6px;" alt="thumbnail" />',
-            obj.image.url,
+            image_url,
         )
 
-    thumbnail.short_description = "Preview"
-    thumbnail.allow_tags = True
+    thumbnail_preview.short_description = "Preview"
+    thumbnail_preview.allow_tags = True
 
     def preview(self, obj):
         if not obj.image:
             return "No image uploaded."
+        # Serve the pre-generated thumbnail here too — the change form
+        # shouldn't download a multi-MB original just to show a preview.
+        # Clicking through opens the full-size photo.
+        image_url = obj.thumbnail.url if obj.thumbnail else obj.image.url
         return format_html(
-            '<img src="{}" style="max-width: 320px; border-radius: 12px;" alt="preview" />',
+            '<a href="{}" target="_blank" rel="noopener">'
+            '<img src="{}" style="max-width: 320px; border-radius: 12px;" alt="preview" />'
+            "</a>",
             obj.image.url,
+            image_url,
         )
 
     preview.short_description = "Image preview"
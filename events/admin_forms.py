@@ -1,4 +1,5 @@
 from django import forms
+from django.db import IntegrityError, transaction
 from django.forms import inlineformset_factory
 from django.utils import timezone
 
@@ -126,20 +127,35 @@ class EventForm(forms.ModelForm):
         if self.instance and self.instance.pk:
             self.fields['slug'].required = False
     
+    # Upper bound on slug-collision retries before giving up.
+    SLUG_MAX_ATTEMPTS = 16
+
     def save(self, commit=True):
         instance = super().save(commit=False)
         # Auto-generate slug from name if not provided
+        auto_slug = False
         if not instance.slug and instance.name:
             from django.utils.text import slugify
             instance.slug = slugify(instance.name)
-            # Ensure uniqueness
-            base_slug = instance.slug
-            counter = 1
-            while Event.objects.filter(slug=instance.slug).exclude(pk=instance.pk if instance.pk else None).exists():
-                instance.slug = f"{base_slug}-{counter}"
-                counter += 1
+            auto_slug = True
         if commit:
-            instance.save()
+            if auto_slug:
+                # Optimistic save: let the unique index on slug arbitrate.
+                # The common case is one INSERT with no lookup, and two
+                # concurrent creates can't race their way into the same slug
+                # the way a check-then-insert could.
+                base_slug = instance.slug
+                for attempt in range(self.SLUG_MAX_ATTEMPTS):
+                    try:
+                        with transaction.atomic():
+                            instance.save()
+                        break
+                    except IntegrityError:
+                        if attempt == self.SLUG_MAX_ATTEMPTS - 1:
+                            raise
+                        instance.slug = f"{base_slug}-{attempt + 1}"
+            else:
+                instance.save()
         return instance
 
 
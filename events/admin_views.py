@@ -2,26 +2,30 @@ import csv
 import json
 import os
 import re
+import time
 import unicodedata
 import zipfile
-from io import BytesIO, StringIO
-from pathlib import Path, PurePosixPath
+from io import StringIO
+from pathlib import PurePosixPath
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.views import LoginView, LogoutView
+from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
-from django.db.models import Count, Q
-from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.db.models import BooleanField, Case, Count, Q, Value, When
+from django.http import Http404, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
+from django.views.decorators.cache import cache_page
 from django.views.decorators.http import require_http_methods
+from django.views.decorators.vary import vary_on_cookie
 
 from .admin_forms import EventForm, GalleryImportForm, PhotoFormSet
 from .models import Event, Photo, UploadChannel
-from .utils import generate_event_qr_code
-from .validators import DEFAULT_ALLOWED_EXTENSIONS
+from .utils import generate_event_qr_code, zip_compress_type
+from .validators import DEFAULT_ALLOWED_EXTENSIONS, validate_photo_images
 
 
 def is_staff_user(user):
@@ -196,36 +200,36 @@ def _merge_comment_value(current: str, incoming: str) -> str:
 
 @login_required
 @user_passes_test(is_staff_user)
+@cache_page(30)
+@vary_on_cookie
 def admin_dashboard(request):
     """Admin dashboard with statistics."""
     now = timezone.now()
-    
-    # Statistics
-    total_events = Event.objects.count()
-    active_events = Event.objects.filter(is_active=True).count()
+
+    # Statistics: one aggregate over Event instead of one COUNT query per metric
+    event_stats = Event.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+        upcoming=Count(
+            'id',
+            filter=Q(is_active=True) & (Q(start_time__gt=now) | Q(start_time__isnull=True)),
+        ),
+        running=Count(
+            'id',
+            filter=Q(is_active=True)
+            & Q(start_time__lte=now)
+            & (Q(end_time__gte=now) | Q(end_time__isnull=True)),
+        ),
+        past=Count('id', filter=Q(is_active=True) & Q(end_time__lt=now)),
+    )
     total_photos = Photo.objects.count()
-    
-    # Recent events
-    recent_events = Event.objects.order_by('-id')[:5]
-    
-    # Events by status
-    upcoming_events = Event.objects.filter(
-        Q(start_time__gt=now) | Q(start_time__isnull=True),
-        is_active=True
-    ).count()
-    
-    running_events = Event.objects.filter(
-        Q(start_time__lte=now) & (Q(end_time__gte=now) | Q(end_time__isnull=True)),
-        is_active=True
-    ).count()
-    
-    past_events = Event.objects.filter(
-        end_time__lt=now,
-        is_active=True
-    ).count()
-    
+
+    # Recent events. The dashboard only renders a few columns, so skip the
+    # personalization text/color fields on both event querysets.
+    recent_events = Event.objects.only('id', 'name', 'slug', 'is_active').order_by('-id')[:5]
+
     # Events with photo counts
-    events_with_stats = Event.objects.annotate(
+    events_with_stats = Event.objects.only('id', 'name', 'slug', 'is_active').annotate(
         photo_count=Count('photos')
     ).order_by('-id')[:10]
     
@@ -233,12 +237,12 @@ def admin_dashboard(request):
     recent_photos = Photo.objects.select_related('event').order_by('-uploaded_at')[:10]
     
     context = {
-        'total_events': total_events,
-        'active_events': active_events,
+        'total_events': event_stats['total'],
+        'active_events': event_stats['active'],
         'total_photos': total_photos,
-        'upcoming_events': upcoming_events,
-        'running_events': running_events,
-        'past_events': past_events,
+        'upcoming_events': event_stats['upcoming'],
+        'running_events': event_stats['running'],
+        'past_events': event_stats['past'],
         'recent_events': recent_events,
         'events_with_stats': events_with_stats,
         'recent_photos': recent_photos,
@@ -251,7 +255,9 @@ def admin_dashboard(request):
 @user_passes_test(is_staff_user)
 def admin_event_list(request):
     """List all events with management options."""
-    events = Event.objects.annotate(
+    events = Event.objects.only(
+        'id', 'name', 'slug', 'is_active', 'start_time', 'end_time'
+    ).annotate(
         photo_count=Count('photos')
     ).order_by('-id')
     
@@ -404,6 +410,21 @@ def admin_gallery_import(request):
     return render(request, "events/admin/gallery_import.html", {"form": form})
 
 
+def _bulk_photo_upload_errors(request) -> list[str]:
+    """
+    Fail fast on invalid attached images before the formset re-validates
+    each file serially; the batch validator checks them concurrently.
+    """
+    files = list(request.FILES.values())
+    if not files:
+        return []
+    try:
+        validate_photo_images(files)
+    except ValidationError as exc:
+        return list(exc.messages)
+    return []
+
+
 @login_required
 @user_passes_test(is_staff_user)
 @require_http_methods(["GET", "POST"])
@@ -411,7 +432,10 @@ def admin_event_create(request):
     """Create a new event."""
     if request.method == 'POST':
         form = EventForm(request.POST)
-        if form.is_valid():
+        upload_errors = _bulk_photo_upload_errors(request)
+        for error in upload_errors:
+            messages.error(request, error)
+        if form.is_valid() and not upload_errors:
             event = form.save()
             # Now create formset with the saved event instance
             formset = PhotoFormSet(request.POST, request.FILES, instance=event)
@@ -449,7 +473,10 @@ def admin_event_edit(request, event_id):
     if request.method == 'POST':
         form = EventForm(request.POST, instance=event)
         formset = PhotoFormSet(request.POST, request.FILES, instance=event)
-        if form.is_valid() and formset.is_valid():
+        upload_errors = _bulk_photo_upload_errors(request)
+        for error in upload_errors:
+            messages.error(request, error)
+        if not upload_errors and form.is_valid() and formset.is_valid():
             event = form.save()
             formset.save()
             messages.success(request, f'Event "{event.name}" updated successfully.')
@@ -471,19 +498,23 @@ def admin_event_edit(request, event_id):
 @user_passes_test(is_staff_user)
 def admin_event_detail(request, event_id):
     """View event details and manage it."""
-    event = get_object_or_404(Event, id=event_id)
-    
+    # Both counts come back annotated on the event row, so the view issues
+    # one query for the event and one for the photo page instead of three.
+    event = get_object_or_404(
+        Event.objects.annotate(
+            _photo_count=Count('photos'),
+            _photos_with_comments=Count('photos', filter=~Q(photos__comment='')),
+        ),
+        id=event_id,
+    )
+
     photos = event.photos.order_by('-uploaded_at')
-    photo_count = photos.count()
-    
-    # Statistics
-    photos_with_comments = photos.exclude(comment='').count()
-    
+
     context = {
         'event': event,
         'photos': photos[:50],  # Show first 50
-        'photo_count': photo_count,
-        'photos_with_comments': photos_with_comments,
+        'photo_count': event._photo_count,
+        'photos_with_comments': event._photos_with_comments,
         'upload_channels': UploadChannel.objects.filter(current_event=event).order_by('label'),
     }
     
@@ -511,13 +542,21 @@ def admin_event_delete(request, event_id):
 @require_http_methods(["POST"])
 def admin_event_toggle_active(request, event_id):
     """Toggle event active status."""
-    event = get_object_or_404(Event, id=event_id)
-    event.is_active = not event.is_active
-    event.save()
-    
+    # Flip the flag with a single UPDATE instead of SELECT + full-row save.
+    updated = Event.objects.filter(pk=event_id).update(
+        is_active=Case(
+            When(is_active=True, then=Value(False)),
+            default=Value(True),
+            output_field=BooleanField(),
+        )
+    )
+    if not updated:
+        raise Http404('Event not found.')
+
+    event = Event.objects.only('name', 'is_active').get(pk=event_id)
     status = 'activated' if event.is_active else 'deactivated'
     messages.success(request, f'Event "{event.name}" {status}.')
-    
+
     return redirect('events:admin-event-detail', event_id=event_id)
 
 
@@ -550,54 +589,92 @@ def admin_event_generate_qr(request, event_id):
     return redirect('events:admin-event-detail', event_id=event_id)
 
 
-@login_required
-@user_passes_test(is_staff_user)
-def admin_download_event_data(request, event_id):
-    """Download all photos and comments for an event as ZIP + CSV."""
-    event = get_object_or_404(Event, id=event_id)
-    photos = event.photos.order_by('uploaded_at')
-    
-    if not photos.exists():
-        messages.warning(request, 'No photos to download for this event.')
-        return redirect('events:admin-event-detail', event_id=event_id)
-    
-    # Create ZIP file in memory
-    zip_buffer = BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        # Add all photos
-        for idx, photo in enumerate(photos, 1):
+class _ZipStreamBuffer:
+    """Unseekable write target for ZipFile; the response generator drains it."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _stream_event_export_zip(event, photos):
+    """Yield the export ZIP chunk by chunk instead of building it in memory."""
+    buffer = _ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        csv_buffer = StringIO()
+        csv_writer = csv.writer(csv_buffer)
+        csv_writer.writerow(['Photo Number', 'Filename', 'Comment', 'Uploaded At', 'Uploader IP'])
+        json_photos = []
+        total_photos = 0
+
+        # One walk over the queryset builds the archive, the CSV rows and
+        # the JSON metadata together. iterator() keeps the result cache off
+        # so huge events stream in 500-row chunks instead of materializing
+        # every Photo row. JPEG/PNG/HEIC are already compressed, so store
+        # them verbatim instead of wasting CPU re-deflating them.
+        for idx, photo in enumerate(photos.iterator(chunk_size=500), 1):
+            total_photos = idx
+
+            # Compute the shared per-photo values once; the CSV row and the
+            # JSON record below reuse them.
+            filename = os.path.basename(photo.image.name) if photo.image else f"photo_{idx}.jpg"
+            comment = photo.comment or ''
+            uploaded_at = photo.uploaded_at
+            uploader_ip = str(photo.uploader_ip) if photo.uploader_ip else None
+
             if photo.image and default_storage.exists(photo.image.name):
                 try:
                     with default_storage.open(photo.image.name, 'rb') as img_file:
-                        # Get original filename or create one
-                        original_filename = os.path.basename(photo.image.name)
-                        # Ensure unique filename
-                        zip_filename = f"photos/{idx:04d}_{original_filename}"
-                        zip_file.writestr(zip_filename, img_file.read())
-                except Exception as e:
+                        # Ensure unique filename; a bare ZipInfo would stamp
+                        # the entry 1980-01-01, so date it from the upload.
+                        zip_info = zipfile.ZipInfo(
+                            f"photos/{idx:04d}_{filename}",
+                            date_time=(
+                                uploaded_at.timetuple()[:6]
+                                if uploaded_at
+                                else time.localtime()[:6]
+                            ),
+                        )
+                        zip_info.compress_type = zip_compress_type(filename)
+                        # Copy 1 MiB at a time so a photo never sits fully in
+                        # RAM, draining the buffer between chunks.
+                        with zip_file.open(zip_info, 'w', force_zip64=True) as dest:
+                            while chunk := img_file.read(1024 * 1024):
+                                dest.write(chunk)
+                                yield buffer.take()
+                except Exception:
                     # Skip files that can't be read
-                    continue
-        
-        # Create CSV with comments
-        csv_buffer = StringIO()
-        csv_writer = csv.writer(csv_buffer)
-        csv_writer.writerow(['Photo Number', 'Filename', 'Comment', 'Uploaded At', 'Uploader IP'])
-        
-        for idx, photo in enumerate(photos, 1):
-            original_filename = os.path.basename(photo.image.name) if photo.image else f"photo_{idx}.jpg"
+                    pass
+
             csv_writer.writerow([
                 idx,
-                original_filename,
-                photo.comment or '',
-                photo.uploaded_at.strftime('%Y-%m-%d %H:%M:%S') if photo.uploaded_at else '',
-                str(photo.uploader_ip) if photo.uploader_ip else '',
+                filename,
+                comment,
+                uploaded_at.strftime('%Y-%m-%d %H:%M:%S') if uploaded_at else '',
+                uploader_ip or '',
             ])
-        
-        csv_buffer.seek(0)
+            json_photos.append({
+                'number': idx,
+                'filename': filename,
+                'comment': comment,
+                'uploaded_at': uploaded_at.isoformat() if uploaded_at else None,
+                'uploader_ip': uploader_ip,
+            })
+            yield buffer.take()
+
         zip_file.writestr('comments.csv', csv_buffer.getvalue().encode('utf-8'))
-        
-        # Create JSON with metadata
+
         json_data = {
             'event': {
                 'name': event.name,
@@ -605,32 +682,35 @@ def admin_download_event_data(request, event_id):
                 'start_time': event.start_time.isoformat() if event.start_time else None,
                 'end_time': event.end_time.isoformat() if event.end_time else None,
             },
-            'photos': [
-                {
-                    'number': idx,
-                    'filename': os.path.basename(photo.image.name) if photo.image else f"photo_{idx}.jpg",
-                    'comment': photo.comment or '',
-                    'uploaded_at': photo.uploaded_at.isoformat() if photo.uploaded_at else None,
-                    'uploader_ip': str(photo.uploader_ip) if photo.uploader_ip else None,
-                }
-                for idx, photo in enumerate(photos, 1)
-            ],
-            'total_photos': photos.count(),
+            'photos': json_photos,
+            'total_photos': total_photos,
             'exported_at': timezone.now().isoformat(),
         }
-        
-        json_buffer = BytesIO()
-        json_buffer.write(json.dumps(json_data, indent=2).encode('utf-8'))
-        json_buffer.seek(0)
-        zip_file.writestr('metadata.json', json_buffer.getvalue())
-    
-    zip_buffer.seek(0)
-    
-    # Create response
-    response = HttpResponse(zip_buffer.getvalue(), content_type='application/zip')
+        zip_file.writestr('metadata.json', json.dumps(json_data, indent=2).encode('utf-8'))
+
+    yield buffer.take()
+
+
+@login_required
+@user_passes_test(is_staff_user)
+def admin_download_event_data(request, event_id):
+    """Download all photos and comments for an event as ZIP + CSV."""
+    event = get_object_or_404(Event, id=event_id)
+    photos = event.photos.only('image', 'comment', 'uploaded_at', 'uploader_ip').order_by('uploaded_at')
+
+    if not photos.exists():
+        messages.warning(request, 'No photos to download for this event.')
+        return redirect('events:admin-event-detail', event_id=event_id)
+
+    # Stream the archive so memory stays flat and the first byte goes out
+    # immediately, regardless of how many photos the event has.
+    response = StreamingHttpResponse(
+        _stream_event_export_zip(event, photos),
+        content_type='application/zip',
+    )
     safe_filename = event.slug.replace(' ', '_')
     response['Content-Disposition'] = f'attachment; filename="{safe_filename}_event_data.zip"'
-    
+
     return response
 
 
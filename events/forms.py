@@ -4,11 +4,30 @@ from .models import Photo
 from .validators import validate_photo_image
 
 
+class MultiplePhotoInput(forms.ClearableFileInput):
+    """
+    File input that lets mobile browsers select several photos at once.
+
+    The bulk path in the upload view reads `request.FILES.getlist` directly;
+    the bound form only ever persists one Photo, so the field itself is
+    handed a single file even when the browser submitted a batch.
+    """
+
+    allow_multiple_selected = True
+
+    def value_from_datadict(self, data, files, name):
+        upload = super().value_from_datadict(data, files, name)
+        if isinstance(upload, list):
+            return upload[0] if upload else None
+        return upload
+
+
 class PhotoUploadForm(forms.ModelForm):
     class Meta:
         model = Photo
         fields = ["image", "comment"]
         widgets = {
+            "image": MultiplePhotoInput,
             "comment": forms.Textarea(
                 attrs={
                     "rows": 3,
@@ -22,6 +41,7 @@ class PhotoUploadForm(forms.ModelForm):
         self.fields["image"].widget.attrs.update(
             {
                 "accept": "image/*",
+                "multiple": True,
             }
         )
 
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-08-28 01:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_ensure_demo_event_exists'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['is_active', 'start_time', 'end_time'], name='ev_active_times_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='photo',
+            index=models.Index(fields=['event', 'uploaded_at'], name='ph_event_time_idx'),
+        ),
+    ]
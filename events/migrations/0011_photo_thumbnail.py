@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-08-28 01:21
+
+import events.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_add_status_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='photo',
+            name='thumbnail',
+            field=models.ImageField(blank=True, editable=False, upload_to=events.models.event_photo_thumbnail_upload_to),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-08-28 01:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0011_photo_thumbnail'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='photo',
+            name='ph_event_time_idx',
+        ),
+        migrations.AddIndex(
+            model_name='photo',
+            index=models.Index(fields=['event', '-uploaded_at'], name='photo_event_uploaded_idx'),
+        ),
+    ]
@@ -1,24 +1,36 @@
-import os
+import hashlib
 import secrets
 import uuid
-from pathlib import Path
+from io import BytesIO
+from pathlib import Path, PurePosixPath
 
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.db import models
+from django.utils.functional import cached_property
 
 from .validators import validate_photo_image
 
 
 def event_photo_upload_to(instance, filename: str) -> str:
     """
-    Store uploaded images grouped by event slug.
-    Example: photos/my-event/unique-image-name.jpg
+    Store uploaded images grouped by event slug, sharded into 256 buckets
+    by a hash of the filename so no single directory grows unbounded.
+    Example: photos/my-event/a3/unique-image-name.jpg
     """
-    base, ext = os.path.splitext(filename)
-    ext = ext.lower()
-    sanitized_name = base.replace(" ", "_")
+    # Upload paths are always posix-style, so splitting with PurePosixPath
+    # and formatting the result directly avoids the Path-join round trip.
+    name = PurePosixPath(filename)
+    sanitized_name = name.stem.replace(" ", "_")
     event_slug = instance.event.slug if instance.event_id else "unsorted"
-    return str(Path("photos") / event_slug / f"{sanitized_name}{ext}")
+    shard = hashlib.blake2b(sanitized_name.encode(), digest_size=1).hexdigest()
+    return f"photos/{event_slug}/{shard}/{sanitized_name}{name.suffix.lower()}"
+
+
+def event_photo_thumbnail_upload_to(instance, filename: str) -> str:
+    """Store small admin-preview thumbnails next to their event's photos."""
+    event_slug = instance.event.slug if instance.event_id else "unsorted"
+    return str(Path("thumbnails") / event_slug / filename)
 
 
 class Event(models.Model):
@@ -43,6 +55,13 @@ class Event(models.Model):
 
     class Meta:
         ordering = ("name",)
+        indexes = [
+            # Dashboard status counts filter on is_active plus the time bounds.
+            models.Index(
+                fields=["is_active", "start_time", "end_time"],
+                name="ev_active_times_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -52,10 +71,12 @@ class Event(models.Model):
 
         return reverse("events:event-upload", kwargs={"slug": self.slug})
     
-    def get_theme_colors(self) -> dict:
+    @cached_property
+    def theme_colors(self) -> dict:
         """
-        Returns a dictionary of theme colors, using defaults if custom colors are not set.
+        Dictionary of theme colors, using defaults if custom colors are not set.
         Defaults match the main website/demo palette (Momentbasket brand).
+        Cached per instance so repeated template accesses reuse one dict.
         """
         return {
             "bg_color_1": self.bg_color_1 or "#f9e0ff",
@@ -120,12 +141,56 @@ class Photo(models.Model):
         upload_to=event_photo_upload_to,
         validators=[validate_photo_image],
     )
+    thumbnail = models.ImageField(
+        upload_to=event_photo_thumbnail_upload_to,
+        blank=True,
+        editable=False,
+    )
     comment = models.TextField(blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     uploader_ip = models.GenericIPAddressField(blank=True, null=True)
 
     class Meta:
         ordering = ("-uploaded_at",)
+        indexes = [
+            # Gallery and admin listings read each event's photos newest
+            # first, so the index stores uploaded_at descending to match.
+            models.Index(fields=["event", "-uploaded_at"], name="photo_event_uploaded_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Photo for {self.event.name} @ {self.uploaded_at:%Y-%m-%d %H:%M:%S}"
+
+    def build_thumbnail(self) -> bool:
+        """
+        Render a small WEBP preview so admin listings don't ship full-size
+        photos. Returns False (and leaves the field blank) when the source
+        can't be decoded, e.g. HEIC without codec support.
+        """
+        if not self.image:
+            return False
+        try:
+            from PIL import Image
+        except ImportError:  # pragma: no cover - import guard
+            return False
+        try:
+            # Rewind rather than close afterwards: the same file object still
+            # has to be written to storage when the model saves.
+            source = self.image.open("rb")
+            try:
+                img = Image.open(source)
+                img.thumbnail((120, 120), Image.LANCZOS)
+                buf = BytesIO()
+                img.convert("RGB").save(buf, format="WEBP", quality=72)
+            finally:
+                source.seek(0)
+        except Exception:
+            return False
+        thumb_name = f"{Path(self.image.name).stem}.webp"
+        self.thumbnail.save(thumb_name, ContentFile(buf.getvalue()), save=False)
+        return True
+
+    def save(self, *args, **kwargs):
+        if self.image and not self.thumbnail:
+            self.build_thumbnail()
+        super().save(*args, **kwargs)
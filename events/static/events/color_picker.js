@@ -0,0 +1,35 @@
+/*
+ * Syncs each ColorPickerWidget's text input with its color input.
+ *
+ * One delegated listener on document covers every widget on the page, so
+ * the cost no longer scales with the number of color fields. Inputs are
+ * paired by a shared data-color-pair attribute.
+ */
+(function () {
+    "use strict";
+
+    var HEX_RE = /^#[0-9A-Fa-f]{6}$/;
+
+    document.addEventListener("input", function (event) {
+        var source = event.target;
+        var pair = source.dataset && source.dataset.colorPair;
+        if (!pair) {
+            return;
+        }
+        var selector = source.type === "color" ? 'input[type="text"]' : 'input[type="color"]';
+        var target = document.querySelector(
+            selector + '[data-color-pair="' + CSS.escape(pair) + '"]'
+        );
+        if (!target) {
+            return;
+        }
+        if (source.type === "color") {
+            target.value = source.value;
+        } else {
+            var value = source.value.trim();
+            if (HEX_RE.test(value)) {
+                target.value = value;
+            }
+        }
+    });
+})();
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
 import secrets
+import zipfile
+from functools import lru_cache
 from pathlib import Path
 
 from django.conf import settings
@@ -10,6 +13,18 @@ from django.urls import reverse
 from .models import Event, UploadChannel
 
 
+# File formats that are already entropy-coded; DEFLATE barely shrinks them
+# and burns CPU per exported MB, so ZIP entries store them verbatim.
+_PRECOMPRESSED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".heic", ".heif", ".gif", ".zip")
+
+
+def zip_compress_type(filename: str) -> int:
+    """Pick the ZIP compression method for a member based on its extension."""
+    if filename.lower().endswith(_PRECOMPRESSED_EXTENSIONS):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
 def channel_uid_is_valid(channel: UploadChannel, uid: str | None) -> bool:
     if not uid:
         return False
@@ -22,15 +37,29 @@ def channel_uid_is_valid(channel: UploadChannel, uid: str | None) -> bool:
     return False
 
 
-def get_event_qr_paths(event_slug: str) -> tuple[Path, str]:
-    relative_path = Path("qrcodes") / f"{event_slug}.png"
+@lru_cache(maxsize=512)
+def _qr_file_exists(path: str) -> bool:
+    """
+    Cached stat for QR images so repeated admin renders don't hit the
+    filesystem per row. Cleared whenever a QR file is (re)generated.
+    """
+    return Path(path).exists()
+
+
+# Memoized because admin list/detail renders resolve these per event row;
+# the result depends only on the arguments plus MEDIA_ROOT/MEDIA_URL, so
+# tests that override those settings call .cache_clear().
+@lru_cache(maxsize=1024)
+def get_event_qr_paths(event_slug: str, fmt: str = "svg") -> tuple[Path, str]:
+    relative_path = Path("qrcodes") / f"{event_slug}.{fmt}"
     media_file = Path(settings.MEDIA_ROOT) / relative_path
     media_url = f"{settings.MEDIA_URL}{relative_path.as_posix()}"
     return media_file, media_url
 
 
-def get_upload_channel_qr_paths(channel_slug: str) -> tuple[Path, str]:
-    relative_path = Path("qrcodes") / f"ch_{channel_slug}.png"
+@lru_cache(maxsize=1024)
+def get_upload_channel_qr_paths(channel_slug: str, fmt: str = "svg") -> tuple[Path, str]:
+    relative_path = Path("qrcodes") / f"ch_{channel_slug}.{fmt}"
     media_file = Path(settings.MEDIA_ROOT) / relative_path
     media_url = f"{settings.MEDIA_URL}{relative_path.as_posix()}"
     return media_file, media_url
@@ -83,6 +112,72 @@ def read_upload_channel_qr_metadata(channel_slug: str) -> dict[str, str] | None:
     return None
 
 
+def _write_qr_image(qr_target_url: str, qr_image_path: Path) -> None:
+    """
+    Encode `qr_target_url` into the file at `qr_image_path`, dispatching on
+    its suffix (.svg default, .png for raster downloads).
+
+    Prefers segno, which emits SVG as plain path data and PNG directly
+    through zlib — both markedly faster than the qrcode+PIL raster path —
+    and falls back to qrcode where segno is not installed. Both use error
+    correction level M.
+    """
+    qr_image_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        import segno
+    except ImportError:
+        pass
+    else:
+        segno.make(qr_target_url, error="m").save(str(qr_image_path), scale=10, border=4)
+        return
+
+    try:
+        import qrcode
+    except ImportError as exc:  # pragma: no cover - import guard
+        raise RuntimeError(
+            "No QR library is installed. Install one with 'pip install segno' "
+            "or 'pip install qrcode[pil]'."
+        ) from exc
+
+    if qr_image_path.suffix == ".svg":
+        import qrcode.image.svg
+
+        img = qrcode.make(
+            qr_target_url,
+            error_correction=qrcode.constants.ERROR_CORRECT_M,
+            box_size=10,
+            border=4,
+            image_factory=qrcode.image.svg.SvgPathImage,
+        )
+        img.save(qr_image_path)
+        return
+
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(qr_target_url)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    img.save(qr_image_path)
+
+
+def _write_qr_metadata(metadata_path: Path, qr_uid: str, qr_target_url: str) -> None:
+    """
+    Atomically replace the sidecar JSON so a concurrent reader never sees a
+    half-written file.
+    """
+    metadata_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = metadata_path.with_suffix(".json.tmp")
+    tmp_path.write_text(
+        json.dumps({"uid": qr_uid, "target_url": qr_target_url}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, metadata_path)
+
+
 def _normalize_qr_base_url(base_url: str | None) -> str:
     base_url = (base_url or settings.EVENT_BASE_URL).rstrip("/")
     if not base_url:
@@ -102,65 +197,50 @@ def _normalize_qr_base_url(base_url: str | None) -> str:
 def generate_upload_channel_qr_code(
     channel: UploadChannel,
     base_url: str | None = None,
+    fmt: str = "svg",
 ) -> Path:
     """Write QR image + metadata for a reusable upload channel (venue / photographer / designer)."""
-    try:
-        import qrcode
-    except ImportError as exc:  # pragma: no cover - import guard
-        raise RuntimeError(
-            "qrcode library is not installed. Install it with 'pip install qrcode[pil]'."
-        ) from exc
-
     base_url = _normalize_qr_base_url(base_url)
     qr_uid = channel.upload_uid
 
     upload_path = reverse("events:channel-upload", kwargs={"channel_slug": channel.slug})
     qr_target_url = f"{base_url}{upload_path}?uid={qr_uid}"
 
-    qr_image_path, _ = get_upload_channel_qr_paths(channel.slug)
-    qr_image_path.parent.mkdir(parents=True, exist_ok=True)
+    qr_image_path, _ = get_upload_channel_qr_paths(channel.slug, fmt=fmt)
+    # Channel URLs are stable, so repeat calls usually resolve to the exact
+    # URL already encoded in the PNG on disk; skip the re-encode then.
+    existing = read_upload_channel_qr_metadata(channel.slug)
+    if existing and existing.get("target_url") == qr_target_url and qr_image_path.exists():
+        return qr_image_path
 
-    qr = qrcode.QRCode(
-        version=None,
-        error_correction=qrcode.constants.ERROR_CORRECT_M,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(qr_target_url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-    img.save(qr_image_path)
+    _write_qr_image(qr_target_url, qr_image_path)
 
-    metadata_path = get_upload_channel_qr_metadata_path(channel.slug)
-    metadata_path.parent.mkdir(parents=True, exist_ok=True)
-    metadata_path.write_text(
-        json.dumps({"uid": qr_uid, "target_url": qr_target_url}, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    _write_qr_metadata(get_upload_channel_qr_metadata_path(channel.slug), qr_uid, qr_target_url)
+    _qr_file_exists.cache_clear()
     return qr_image_path
 
 
-def generate_event_qr_code(event: Event, base_url: str | None = None) -> Path | None:
+def generate_event_qr_code(
+    event: Event,
+    base_url: str | None = None,
+    fmt: str = "svg",
+) -> Path | None:
     """
     If this event is the `current_event` of any UploadChannel, regenerate QR file(s)
     for those channels (stable URL, reusable across events).
 
     Otherwise generate the legacy per-event-slug QR (random uid each time).
+
+    SVG is the default output — a few hundred bytes of path data that the
+    browser scales losslessly; pass fmt="png" for raster downloads.
     """
     channels = UploadChannel.objects.filter(current_event=event)
     if channels.exists():
         last: Path | None = None
         for channel in channels:
-            last = generate_upload_channel_qr_code(channel, base_url=base_url)
+            last = generate_upload_channel_qr_code(channel, base_url=base_url, fmt=fmt)
         return last
 
-    try:
-        import qrcode
-    except ImportError as exc:  # pragma: no cover - import guard
-        raise RuntimeError(
-            "qrcode library is not installed. Install it with 'pip install qrcode[pil]'."
-        ) from exc
-
     base_url = _normalize_qr_base_url(base_url)
 
     upload_path = reverse("events:event-upload", kwargs={"slug": event.slug})
@@ -172,29 +252,33 @@ def generate_event_qr_code(event: Event, base_url: str | None = None) -> Path |
         qr_uid = f"{secrets.randbelow(100_000_000):08d}"
     qr_target_url = f"{base_url}{upload_path}?uid={qr_uid}"
 
-    qr_image_path, _ = get_event_qr_paths(event.slug)
-    qr_image_path.parent.mkdir(parents=True, exist_ok=True)
+    qr_image_path, _ = get_event_qr_paths(event.slug, fmt=fmt)
+    # Random uids rotate the URL on every call, so this only short-circuits
+    # for the demo event's fixed uid — the one legacy case that is stable.
+    existing = read_event_qr_metadata(event.slug)
+    if existing and existing.get("target_url") == qr_target_url and qr_image_path.exists():
+        return qr_image_path
 
-    qr = qrcode.QRCode(
-        version=None,
-        error_correction=qrcode.constants.ERROR_CORRECT_M,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(qr_target_url)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-    img.save(qr_image_path)
+    _write_qr_image(qr_target_url, qr_image_path)
 
-    metadata_path = get_event_qr_metadata_path(event.slug)
-    metadata_path.parent.mkdir(parents=True, exist_ok=True)
-    metadata_path.write_text(
-        json.dumps({"uid": qr_uid, "target_url": qr_target_url}, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    _write_qr_metadata(get_event_qr_metadata_path(event.slug), qr_uid, qr_target_url)
+    _qr_file_exists.cache_clear()
     return qr_image_path
 
 
+def _existing_qr_paths(path_getter, slug: str) -> tuple[Path | None, str]:
+    """
+    Resolve the on-disk QR for `slug`, preferring the SVG output and falling
+    back to PNGs generated before the SVG switch. Returns (None, "") when
+    neither exists.
+    """
+    for fmt in ("svg", "png"):
+        qr_file, qr_url = path_getter(slug, fmt=fmt)
+        if _qr_file_exists(str(qr_file)):
+            return qr_file, qr_url
+    return None, ""
+
+
 def qr_preview_payload_for_event(event: Event) -> dict | None:
     """
     Prefer channel-based QR when this event is a channel's current_event; else legacy file on disk.
@@ -204,9 +288,8 @@ def qr_preview_payload_for_event(event: Event) -> dict | None:
         UploadChannel.objects.filter(current_event=event).order_by("label").first()
     )
     if channel:
-        _, qr_url = get_upload_channel_qr_paths(channel.slug)
-        qr_file = Path(settings.MEDIA_ROOT) / "qrcodes" / f"ch_{channel.slug}.png"
-        if not qr_file.exists():
+        qr_file, qr_url = _existing_qr_paths(get_upload_channel_qr_paths, channel.slug)
+        if qr_file is None:
             return None
         metadata = read_upload_channel_qr_metadata(channel.slug) or {}
         upload_url = metadata.get("target_url") or ""
@@ -221,9 +304,8 @@ def qr_preview_payload_for_event(event: Event) -> dict | None:
 
     if not event.slug:
         return None
-    _, qr_url = get_event_qr_paths(event.slug)
-    qr_file = Path(settings.MEDIA_ROOT) / "qrcodes" / f"{event.slug}.png"
-    if not qr_file.exists():
+    qr_file, qr_url = _existing_qr_paths(get_event_qr_paths, event.slug)
+    if qr_file is None:
         return None
     metadata = read_event_qr_metadata(event.slug) or {}
     upload_url = metadata.get("target_url") or f"{settings.EVENT_BASE_URL.rstrip('/')}{event.get_absolute_url()}"
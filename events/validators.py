@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Iterable
 
 from django.conf import settings
@@ -26,48 +28,148 @@ DEFAULT_ALLOWED_EXTENSIONS: Iterable[str] = (
 )
 
 
-def validate_photo_image(value):
-    max_size = getattr(settings, "PHOTO_MAX_UPLOAD_SIZE", DEFAULT_MAX_UPLOAD_SIZE)
-    allowed_types = getattr(
-        settings, "PHOTO_ALLOWED_CONTENT_TYPES", DEFAULT_ALLOWED_CONTENT_TYPES
+# First 8 bytes of every PNG file, compared as one integer instead of a
+# byte-by-byte prefix scan.
+_PNG_SIGNATURE = 0x89504E470D0A1A0A
+# ISO-BMFF brand strings (bytes 4-12) used by HEIC/HEIF captures.
+_HEIC_BRANDS = frozenset(
+    {
+        b"ftypheic",
+        b"ftypheix",
+        b"ftypheim",
+        b"ftypheis",
+        b"ftyphevc",
+        b"ftypheif",
+        b"ftypmif1",
+        b"ftypmsf1",
+    }
+)
+
+
+# The allowed sets and size limit rarely change at runtime, so they are
+# normalized once instead of lowercasing per upload. lru_cache (rather than
+# module constants) keeps settings overrides in tests working via
+# cache_clear().
+@lru_cache(maxsize=1)
+def _allowed_content_types() -> frozenset[str]:
+    return frozenset(
+        ct.lower()
+        for ct in getattr(settings, "PHOTO_ALLOWED_CONTENT_TYPES", DEFAULT_ALLOWED_CONTENT_TYPES)
     )
-    allowed_exts = tuple(
-        getattr(settings, "PHOTO_ALLOWED_EXTENSIONS", DEFAULT_ALLOWED_EXTENSIONS)
+
+
+@lru_cache(maxsize=1)
+def _allowed_extensions() -> frozenset[str]:
+    return frozenset(
+        ext.lower()
+        for ext in getattr(settings, "PHOTO_ALLOWED_EXTENSIONS", DEFAULT_ALLOWED_EXTENSIONS)
     )
 
+
+@lru_cache(maxsize=1)
+def _max_upload_size() -> int:
+    return int(getattr(settings, "PHOTO_MAX_UPLOAD_SIZE", DEFAULT_MAX_UPLOAD_SIZE))
+
+
+def _assert_rewound(value) -> None:
+    """DEBUG-only guard that validation left the file position at zero."""
+    if settings.DEBUG:
+        try:
+            position = value.tell()
+        except (AttributeError, OSError, ValueError):
+            return
+        assert position == 0, f"validate_photo_image left file position at {position}"
+
+
+def _sniff_image_signature(value) -> bool:
+    """
+    Return True when the leading bytes positively identify a supported image
+    format (PNG, JPEG, or a HEIC/HEIF brand). Inconclusive or unreadable
+    files return False so the caller falls back to name/type checks.
+    """
+    try:
+        head = value.read(12)
+        value.seek(0)
+    except (AttributeError, OSError, ValueError):
+        return False
+    if len(head) < 12:
+        return False
+    sig64 = int.from_bytes(head[:8], "big")
+    if sig64 == _PNG_SIGNATURE:
+        return True
+    if (sig64 >> 40) == 0xFFD8FF:  # JPEG SOI + marker prefix
+        return True
+    return head[4:12] in _HEIC_BRANDS
+
+
+def validate_photo_image(value):
+    """
+    Validate one uploaded image without reading its contents into memory:
+    the only file access is the `.size` attribute and the bounded 12-byte
+    signature sniff (which rewinds), so a 15 MB upload costs 12 bytes of
+    validation I/O and the file position is untouched for whoever saves it.
+    """
+    # Size is the cheapest check (one attribute read), so reject oversized
+    # uploads before doing any name/type inspection.
+    file_size = getattr(value, "size", None)
+    if file_size and file_size > _max_upload_size():
+        readable_limit = round(_max_upload_size() / (1024 * 1024), 1)
+        raise ValidationError(
+            _("Image file is too large (max %(size)s MB)."),
+            params={"size": readable_limit},
+        )
+
+    # A confirmed magic-byte match trumps the client-supplied filename and
+    # content type, which are both trivially spoofable anyway.
+    if _sniff_image_signature(value):
+        _assert_rewound(value)
+        return value
+
+    allowed_types = _allowed_content_types()
+    allowed_exts = _allowed_extensions()
+
     content_type = getattr(value, "content_type", "") or ""
-    if content_type:
-        normalized_content_type = content_type.split(";")[0].strip().lower()
-        allowed_normalized = [ct.lower() for ct in allowed_types]
-    else:
-        normalized_content_type = ""
-        allowed_normalized = [ct.lower() for ct in allowed_types]
+    normalized_content_type = content_type.split(";")[0].strip().lower() if content_type else ""
 
     name = getattr(value, "name", "")
     extension = os.path.splitext(name)[1].lower()
-    allowed_exts_lower = [ext.lower() for ext in allowed_exts]
 
-    is_allowed_type = (
-        normalized_content_type in allowed_normalized
-        if normalized_content_type
-        else False
-    )
-    is_allowed_extension = extension in allowed_exts_lower
+    is_allowed_type = normalized_content_type in allowed_types
+    is_allowed_extension = extension in allowed_exts
 
     if not (is_allowed_type or is_allowed_extension):
-        allowed_display = sorted(set(allowed_types) | set(allowed_exts))
+        allowed_display = sorted(allowed_types | allowed_exts)
         raise ValidationError(
             _("Unsupported image type. Please upload one of: %(types)s."),
             params={"types": ", ".join(allowed_display)},
         )
 
-    file_size = getattr(value, "size", None)
-    if file_size and file_size > int(max_size):
-        readable_limit = round(max_size / (1024 * 1024), 1)
-        raise ValidationError(
-            _("Image file is too large (max %(size)s MB)."),
-            params={"size": readable_limit},
-        )
-
+    _assert_rewound(value)
     return value
 
+
+def validate_photo_images(files) -> None:
+    """
+    Validate a batch of uploaded images, fanning out over a thread pool when
+    more than one file is attached. All failures are aggregated into a single
+    ValidationError instead of stopping at the first bad file.
+    """
+    files = list(files)
+    if not files:
+        return
+    if len(files) == 1:
+        validate_photo_image(files[0])
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 4)) as executor:
+        futures = [executor.submit(validate_photo_image, file) for file in files]
+
+    errors: list[ValidationError] = []
+    for future in futures:
+        try:
+            future.result()
+        except ValidationError as exc:
+            errors.append(exc)
+    if errors:
+        raise ValidationError(errors)
+
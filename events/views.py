@@ -6,6 +6,9 @@ from io import BytesIO, StringIO
 
 from django.contrib import messages
 from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import BooleanField, Case, Value, When
+from django.db.models.functions import Now
 from django.core.files.storage import default_storage
 from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
@@ -14,7 +17,36 @@ from django.utils import timezone
 
 from .forms import PhotoCommentForm, PhotoUploadForm
 from .models import Event, Photo, UploadChannel
-from .utils import channel_uid_is_valid
+from .utils import channel_uid_is_valid, zip_compress_type
+from .validators import validate_photo_images
+
+
+# Columns the public templates actually read; slug lookups use this to skip
+# hydrating the rest of the Event row on every page view.
+EVENT_PUBLIC_FIELDS = (
+    "id",
+    "name",
+    "slug",
+    "is_active",
+    "start_time",
+    "end_time",
+    "couple_names",
+    "upload_page_subtitle",
+    "gallery_uid",
+    "bg_color_1",
+    "bg_color_2",
+    "bg_color_3",
+    "primary_color",
+    "accent_color_1",
+    "accent_color_2",
+    "text_primary_color",
+    "text_muted_color",
+)
+
+
+def _get_event_or_404(**lookups) -> Event:
+    """Fetch one event narrowed to the public columns, raising Http404 if absent."""
+    return get_object_or_404(Event.objects.only(*EVENT_PUBLIC_FIELDS), **lookups)
 
 
 def landing_page(request: HttpRequest) -> HttpResponse:
@@ -30,7 +62,10 @@ def landing_page(request: HttpRequest) -> HttpResponse:
 def get_client_ip(request: HttpRequest) -> str | None:
     forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+        # partition stops at the first comma instead of splitting the
+        # whole proxy chain into a throwaway list.
+        first, _, _ = forwarded_for.partition(",")
+        return first.strip() or None
     return request.META.get("REMOTE_ADDR")
 
 
@@ -89,6 +124,39 @@ def _event_upload_impl(
                         request,
                         "Hiba történt a megjegyzés mentése során. Kérjük, próbáld újra.",
                     )
+        elif len(request.FILES.getlist("image")) > 1:
+            # Step 1, batch variant: several files in one POST. Validation
+            # fans out over a thread pool and all rows land in a single
+            # INSERT; the per-photo comment step is skipped for batches.
+            files = request.FILES.getlist("image")
+            # Bind the files too: the widget collapses the list to its first
+            # file, so a failed batch doesn't also render a bogus
+            # "this field is required" error under the real one.
+            form = PhotoUploadForm(request.POST, request.FILES)
+            try:
+                validate_photo_images(files)
+            except ValidationError as exc:
+                form.add_error("image", exc)
+            else:
+                try:
+                    uploader_ip = get_client_ip(request)
+                    photos = []
+                    for upload in files:
+                        photo = Photo(event=event, uploader_ip=uploader_ip)
+                        photo.image.save(upload.name, upload, save=False)
+                        photo.build_thumbnail()
+                        photos.append(photo)
+                    Photo.objects.bulk_create(photos, batch_size=500)
+                except Exception:
+                    messages.error(
+                        request,
+                        "Hiba történt a fényképek mentése során. Kérjük, próbáld újra.",
+                    )
+                else:
+                    upload_success_url = upload_success_reverse()
+                    if uid:
+                        upload_success_url = f"{upload_success_url}?uid={uid}"
+                    return redirect(upload_success_url)
         else:
             # Step 1: image upload.
             form = PhotoUploadForm(request.POST, request.FILES)
@@ -129,14 +197,11 @@ def _event_upload_impl(
 
 
 def event_upload(request: HttpRequest, slug: str) -> HttpResponse:
-    try:
-        event = Event.objects.get(slug=slug, is_active=True)
-    except Event.DoesNotExist:
-        try:
-            event = Event.objects.get(slug=slug)
-            return render(request, "events/event_inactive.html", {"event": event})
-        except Event.DoesNotExist:
-            raise Http404("Event not found.") from None
+    # One lookup by slug; active vs. inactive is decided in Python instead
+    # of a second query on the inactive path.
+    event = _get_event_or_404(slug=slug)
+    if not event.is_active:
+        return render(request, "events/event_inactive.html", {"event": event})
 
     return _event_upload_impl(request, event, upload_channel=None)
 
@@ -163,10 +228,7 @@ def channel_upload(request: HttpRequest, channel_slug: str) -> HttpResponse:
 
 
 def upload_success(request: HttpRequest, slug: str) -> HttpResponse:
-    try:
-        event = Event.objects.get(slug=slug)
-    except Event.DoesNotExist as exc:
-        raise Http404("Event not found.") from exc
+    event = _get_event_or_404(slug=slug)
 
     return render(
         request,
@@ -199,21 +261,28 @@ def channel_upload_success(request: HttpRequest, channel_slug: str) -> HttpRespo
 
 
 def event_gallery(request: HttpRequest, slug: str) -> HttpResponse:
-    try:
-        event = Event.objects.get(slug=slug)
-    except Event.DoesNotExist as exc:
-        raise Http404("Event not found.") from exc
+    event = _get_event_or_404(slug=slug)
 
     # Check if event is inactive - still show gallery but with a message
     # (Gallery can be viewed even if event is inactive)
-    photos = event.photos.select_related("event").order_by("-uploaded_at")
+    # The parent event is already in hand, so no select_related JOIN: the
+    # template reads only these photo columns.
+    photos = (
+        Photo.objects.filter(event_id=event.id)
+        .only("id", "image", "comment", "uploaded_at")
+        .order_by("-uploaded_at")
+    )
+    # Bound the page to 48 photos so popular events don't materialize
+    # thousands of rows (and image tags) per request.
+    page_obj = Paginator(photos, 48).get_page(request.GET.get("page"))
 
     return render(
         request,
         "events/gallery.html",
         {
             "event": event,
-            "photos": photos,
+            "photos": page_obj,
+            "page_obj": page_obj,
             "is_customer_gallery": False,
         },
     )
@@ -221,12 +290,13 @@ def event_gallery(request: HttpRequest, slug: str) -> HttpResponse:
 
 def customer_gallery(request: HttpRequest, slug: str, uid: str) -> HttpResponse:
     """Customer gallery view protected by event UID."""
-    try:
-        event = Event.objects.get(slug=slug, gallery_uid__iexact=uid)
-    except Event.DoesNotExist as exc:
-        raise Http404("Event not found.") from exc
+    event = _get_event_or_404(slug=slug, gallery_uid__iexact=uid)
 
-    photos = event.photos.select_related("event").order_by("-uploaded_at")
+    photos = (
+        Photo.objects.filter(event_id=event.id)
+        .only("id", "image", "comment", "uploaded_at")
+        .order_by("-uploaded_at")
+    )
 
     return render(
         request,
@@ -241,10 +311,7 @@ def customer_gallery(request: HttpRequest, slug: str, uid: str) -> HttpResponse:
 
 def customer_gallery_download(request: HttpRequest, slug: str, uid: str) -> HttpResponse:
     """Download event photos/comments from customer gallery."""
-    try:
-        event = Event.objects.get(slug=slug, gallery_uid__iexact=uid)
-    except Event.DoesNotExist as exc:
-        raise Http404("Event not found.") from exc
+    event = _get_event_or_404(slug=slug, gallery_uid__iexact=uid)
 
     photos = event.photos.order_by("uploaded_at")
     if not photos.exists():
@@ -259,7 +326,11 @@ def customer_gallery_download(request: HttpRequest, slug: str, uid: str) -> Http
                     with default_storage.open(photo.image.name, "rb") as image_file:
                         original_filename = os.path.basename(photo.image.name)
                         zip_filename = f"photos/{idx:04d}_{original_filename}"
-                        zip_file.writestr(zip_filename, image_file.read())
+                        zip_file.writestr(
+                            zip_filename,
+                            image_file.read(),
+                            compress_type=zip_compress_type(original_filename),
+                        )
                 except Exception:
                     continue
 
@@ -299,36 +370,31 @@ def customer_gallery_download(request: HttpRequest, slug: str, uid: str) -> Http
 
 
 def event_index(request: HttpRequest) -> HttpResponse:
-    now = timezone.now()
+    # "Running" is decided in SQL against the database clock (Now() instead
+    # of a bound Python datetime); the template iterates the queryset
+    # directly instead of a per-event dict built in Python.
     events = (
         Event.objects.filter(is_active=True)
+        .annotate(
+            is_running=Case(
+                When(start_time__lte=Now(), end_time__gte=Now(), then=Value(True)),
+                When(start_time__lte=Now(), end_time__isnull=True, then=Value(True)),
+                When(start_time__isnull=True, end_time__gte=Now(), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
         .order_by("start_time", "name")
-        .select_related()
     )
 
-    event_rows = []
-    for event in events:
-        is_running = False
-        if event.start_time and event.end_time:
-            is_running = event.start_time <= now <= event.end_time
-        elif event.start_time and not event.end_time:
-            is_running = event.start_time <= now
-        elif not event.start_time and event.end_time:
-            is_running = now <= event.end_time
-
-        event_rows.append(
-            {
-                "object": event,
-                "is_running": is_running,
-            }
-        )
-
     return render(
         request,
         "events/index.html",
         {
-            "events": event_rows,
-            "now": now,
+            "events": events,
+            # Template display only; the is_running annotation above uses
+            # the database clock.
+            "now": timezone.now(),
         },
     )
 
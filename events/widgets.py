@@ -1,13 +1,24 @@
+import re
+
 from django import forms
 from django.forms.utils import flatatt
 from django.utils.safestring import mark_safe
 
+_HEX_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
 
 class ColorPickerWidget(forms.TextInput):
     """
     A widget that displays both a color picker and a text input for hex color codes.
+
+    The sync between the two inputs lives in a single static JS file using
+    event delegation, so pages with many color fields load one script and
+    one listener instead of an inline <script> per field.
     """
-    
+
+    class Media:
+        js = ("events/color_picker.js",)
+
     def __init__(self, attrs=None):
         default_attrs = {
             'type': 'text',
@@ -26,8 +37,8 @@ class ColorPickerWidget(forms.TextInput):
         if value:
             # Ensure value starts with # for consistency
             if not value.startswith('#'):
-                return f'#{value}'
-            return value
+                value = f'#{value}'
+            return value if _HEX_RE.match(value) else ''
         return ''
     
     def render(self, name, value, attrs=None, renderer=None):
@@ -36,55 +47,33 @@ class ColorPickerWidget(forms.TextInput):
         """
         if attrs is None:
             attrs = {}
-        
+
         # Get the formatted value
         formatted_value = self.format_value(value)
-        
+
         # Set default color for color picker if value is empty
         color_value = formatted_value if formatted_value else '#000000'
-        
-        # Build the text input attributes
-        text_attrs = self.build_attrs(attrs, {'name': name, 'value': formatted_value})
+
+        # Build the text input attributes; data-color-pair ties this input
+        # to its color picker for the delegated listener in color_picker.js.
+        text_attrs = self.build_attrs(
+            attrs, {'name': name, 'value': formatted_value, 'data-color-pair': name}
+        )
         text_input = super().render(name, formatted_value, text_attrs, renderer)
-        
+
         # Build the color picker attributes
         color_attrs = {
             'type': 'color',
             'id': f'{name}_color_picker',
             'value': color_value,
+            'data-color-pair': name,
             'style': 'width: 50px; height: 38px; margin-left: 8px; vertical-align: middle; cursor: pointer; border: 1px solid #ccc; border-radius: 4px;',
         }
         color_input = f'<input {flatatt(color_attrs)}>'
-        
-        # JavaScript to sync color picker with text input
-        js = f'''
-        <script>
-        (function() {{
-            var textInput = document.querySelector('input[name="{name}"]');
-            var colorInput = document.getElementById('{name}_color_picker');
-            
-            if (textInput && colorInput) {{
-                // Update color picker when text input changes
-                textInput.addEventListener('input', function() {{
-                    var value = this.value.trim();
-                    if (value.match(/^#[0-9A-Fa-f]{{6}}$/)) {{
-                        colorInput.value = value;
-                    }}
-                }});
-                
-                // Update text input when color picker changes
-                colorInput.addEventListener('input', function() {{
-                    textInput.value = this.value;
-                }});
-            }}
-        }})();
-        </script>
-        '''
-        
+
         return mark_safe(
             f'<div style="display: flex; align-items: center;">'
             f'{text_input}'
             f'{color_input}'
             f'</div>'
-            f'{js}'
         )